@@ -522,15 +522,15 @@ def is_git_repo(path: Path = None) -> bool:
 
     try:
         # Use git command to check if inside a work tree
-        subprocess.run(
+        result = subprocess.run(
             ["git", "rev-parse", "--is-inside-work-tree"],
-            check=True,
+            check=False,
             capture_output=True,
             cwd=path,
         )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except FileNotFoundError:
         return False
+    return result.returncode == 0
 
 def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Optional[str]]:
     """Initialize a git repository in the specified path.
@@ -543,13 +543,11 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
         Tuple of (success: bool, error_message: Optional[str])
     """
     try:
-        original_cwd = Path.cwd()
-        os.chdir(project_path)
         if not quiet:
             console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit from Specify template"], check=True, capture_output=True, text=True)
+        subprocess.run(["git", "init"], check=True, capture_output=True, text=True, cwd=project_path)
+        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True, cwd=project_path)
+        subprocess.run(["git", "commit", "-m", "Initial commit from Specify template"], check=True, capture_output=True, text=True, cwd=project_path)
         if not quiet:
             console.print("[green]✓[/green] Git repository initialized")
         return True, None
@@ -564,8 +562,6 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
         if not quiet:
             console.print(f"[red]Error initializing git repository:[/red] {e}")
         return False, error_msg
-    finally:
-        os.chdir(original_cwd)
 
 def handle_vscode_settings(sub_item, dest_file, rel_path, verbose=False, tracker=None) -> None:
     """Handle merging or copying of .vscode/settings.json files."""